@@ -10,6 +10,13 @@ PLIST_PATH="$HOME/Library/LaunchAgents/com.bicameral.sync.plist"
 echo "🔧 Installing Bicameral Sync Daemon service..."
 echo ""
 
+# Escape &, < and > for use inside plist <string> values
+xml_escape() {
+    printf '%s' "$1" | sed -e 's/&/\&amp;/g' -e 's/</\&lt;/g' -e 's/>/\&gt;/g'
+}
+PLIST_SCRIPT_DIR=$(xml_escape "$SCRIPT_DIR")
+PLIST_HOME=$(xml_escape "$HOME")
+
 # Create plist
 cat > "$PLIST_PATH" << EOF
 <?xml version="1.0" encoding="UTF-8"?>
@@ -22,7 +29,7 @@ cat > "$PLIST_PATH" << EOF
     <key>ProgramArguments</key>
     <array>
         <string>/usr/local/bin/python3</string>
-        <string>${SCRIPT_DIR}/redis_sync_daemon.py</string>
+        <string>${PLIST_SCRIPT_DIR}/redis_sync_daemon.py</string>
     </array>
 
     <key>RunAtLoad</key>
@@ -32,10 +39,10 @@ cat > "$PLIST_PATH" << EOF
     <true/>
 
     <key>StandardOutPath</key>
-    <string>${HOME}/.bicameral/sync_stdout.log</string>
+    <string>${PLIST_HOME}/.bicameral/sync_stdout.log</string>
 
     <key>StandardErrorPath</key>
-    <string>${HOME}/.bicameral/sync_stderr.log</string>
+    <string>${PLIST_HOME}/.bicameral/sync_stderr.log</string>
 
     <key>EnvironmentVariables</key>
     <dict>
@@ -48,21 +55,28 @@ EOF
 
 echo "✅ Created plist: $PLIST_PATH"
 
-# Load service
-launchctl unload "$PLIST_PATH" 2>/dev/null || true
-launchctl load "$PLIST_PATH"
+# Load service (bootout/bootstrap replace the deprecated unload/load)
+DOMAIN="gui/$(id -u)"
+launchctl bootout "$DOMAIN/com.bicameral.sync" 2>/dev/null || true
+if ! launchctl bootstrap "$DOMAIN" "$PLIST_PATH" 2>/dev/null; then
+    # bootout can return before the old job is fully torn down
+    sleep 1
+    launchctl bootstrap "$DOMAIN" "$PLIST_PATH"
+fi
 
 echo "✅ Service loaded"
 echo ""
 
-# Check status
+# Check status: ask launchd about our label only (exact match, no dump of
+# every job); the "PID" key is present only while the job is running
 sleep 2
-if launchctl list | grep -q "com.bicameral.sync"; then
+if SERVICE_INFO=$(launchctl list com.bicameral.sync 2>/dev/null); then
+    SERVICE_PID=$(echo "$SERVICE_INFO" | sed -n 's/.*"PID" = \([0-9]*\);.*/\1/p')
     echo "✅ Service is running!"
     echo ""
     echo "📋 Service Info:"
     echo "   Label:  com.bicameral.sync"
-    echo "   Status: $(launchctl list | grep com.bicameral.sync | awk '{print $1}')"
+    echo "   Status: ${SERVICE_PID:--}"
     echo "   Logs:   ~/.bicameral/sync_daemon.log"
     echo "           ~/.bicameral/sync_stdout.log"
     echo "           ~/.bicameral/sync_stderr.log"
@@ -70,8 +84,8 @@ if launchctl list | grep -q "com.bicameral.sync"; then
     echo "🎯 Commands:"
     echo "   Stop:    launchctl stop com.bicameral.sync"
     echo "   Start:   launchctl start com.bicameral.sync"
-    echo "   Restart: launchctl kickstart -k gui/$(id -u)/com.bicameral.sync"
-    echo "   Unload:  launchctl unload $PLIST_PATH"
+    echo "   Restart: launchctl kickstart -k $DOMAIN/com.bicameral.sync"
+    echo "   Unload:  launchctl bootout $DOMAIN/com.bicameral.sync"
     echo "   Logs:    tail -f ~/.bicameral/sync_daemon.log"
 else
     echo "❌ Service failed to start"
@@ -6,6 +6,13 @@ Claude ↔ Gemini Communication System
 __version__ = "2.0.0"
 __author__ = "Team RADIORHINO"
 
-from .client import BicameralClient
-
 __all__ = ["BicameralClient"]
+
+
+def __getattr__(name):
+    # Imported on first use so `import bicameral` (and every CLI command)
+    # doesn't pay for redis/dotenv unless a client is actually needed
+    if name == "BicameralClient":
+        from .client import BicameralClient
+        return BicameralClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,15 +2,37 @@
 Bicameral CLI
 """
 import click
+import fcntl
+import os
+import signal
 import sys
 from pathlib import Path
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from bicameral.client import BicameralClient
 from bicameral.config import load_config
 
+# Written and locked by the sync daemon while it runs; used instead of pgrep/pkill
+SYNC_PID_FILE = Path.home() / '.bicameral' / 'sync.pid'
+SYNC_LOG_FILE = Path.home() / '.bicameral' / 'sync_daemon.log'
+
+def sync_daemon_pid():
+    """Return the sync daemon's PID if it is running, else None
+
+    Only a locked PID file counts: an unlocked one is stale (crash, reboot)
+    and its PID may belong to an unrelated process by now.
+    """
+    try:
+        with open(SYNC_PID_FILE) as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return int(f.read().strip())  # Held by the daemon
+            return None
+    except (FileNotFoundError, ValueError):
+        return None
+
 @click.group()
 @click.version_option(version='2.0.0')
 def cli():
@@ -26,6 +48,7 @@ def send(agent, message_type, message, to):
     """Send a message to another agent"""
     try:
         load_config()
+        from bicameral.client import BicameralClient
         client = BicameralClient(agent_name=agent)
         client.send(to_agent=to, message_type=message_type, content=message)
         click.echo("✅ Message sent!")
@@ -61,55 +84,102 @@ def sync(action):
     """Manage sync daemon"""
     import subprocess
 
+    pid = sync_daemon_pid()
+
     if action == 'start':
-        subprocess.run(['python3', '-m', 'bicameral.sync'], check=True)
+        if pid:
+            click.echo(f"✅ Sync daemon already running (PID: {pid})")
+            return
+        proc = subprocess.Popen(
+            ['python3', '-m', 'bicameral.sync'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        # A daemon that can't start (e.g. local Redis down) exits within
+        # its connect timeout; don't report that as started
+        try:
+            proc.wait(timeout=3)
+        except subprocess.TimeoutExpired:
+            pass
+        else:
+            click.echo("❌ Sync daemon exited on startup", err=True)
+            click.echo(f"   See {SYNC_LOG_FILE} or run: python3 -m bicameral.sync", err=True)
+            sys.exit(1)
+        click.echo(f"✅ Sync daemon started (PID: {proc.pid})")
     elif action == 'stop':
-        subprocess.run(['pkill', '-f', 'bicameral.sync'], check=False)
+        if pid:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except PermissionError:
+                click.echo(f"❌ Sync daemon (PID: {pid}) belongs to another user", err=True)
+                sys.exit(1)
+            except ProcessLookupError:
+                pass  # Exited in the meantime
+        # The daemon removes its own PID file; deleting it here while the
+        # lock is still held would let a second daemon start alongside it
         click.echo("🛑 Sync daemon stopped")
     elif action == 'status':
-        result = subprocess.run(['pgrep', '-f', 'bicameral.sync'], capture_output=True)
-        if result.returncode == 0:
-            click.echo(f"✅ Sync daemon running (PID: {result.stdout.decode().strip()})")
+        if pid:
+            click.echo(f"✅ Sync daemon running (PID: {pid})")
         else:
             click.echo("⚠️  Sync daemon not running")
 
+def probe_redis(host, port, password, stream_key):
+    """PING + XLEN in one round-trip; returns the stream length (raises if down)"""
+    import redis
+
+    r = redis.Redis(
+        host=host,
+        port=port,
+        password=password,
+        socket_connect_timeout=3,
+        decode_responses=True
+    )
+    _, msg_count = r.pipeline(transaction=False).ping().xlen(stream_key).execute()
+    return msg_count
+
 @cli.command()
 def status():
     """Check system status"""
+    from concurrent.futures import ThreadPoolExecutor
     from bicameral.config import get_config
-    import redis
 
     load_config()
 
     click.echo("🏥 Bicameral System Status")
     click.echo("")
 
-    # Local Redis
-    try:
-        r = redis.Redis(
-            host='localhost',
-            port=6379,
-            password=get_config('LOCAL_REDIS_PASSWORD'),
-            decode_responses=True
-        )
-        r.ping()
-        msg_count = r.xlen(get_config('STREAM_KEY', 'bicameral:stream:collab'))
-        click.echo(f"✅ Local Redis: ONLINE ({msg_count} messages)")
-    except:
-        click.echo("❌ Local Redis: OFFLINE")
+    # Probe both Redis instances concurrently: wall-clock is the slower of
+    # the two round-trips rather than their sum
+    stream_key = get_config('STREAM_KEY', 'bicameral:stream:collab')
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        local = pool.submit(probe_redis, 'localhost', 6379,
+                            get_config('LOCAL_REDIS_PASSWORD'), stream_key)
+        vps = pool.submit(probe_redis, get_config('REDIS_HOST'),
+                          int(get_config('REDIS_PORT', 6379)),
+                          get_config('REDIS_PASSWORD'), stream_key)
 
-    # VPS Redis
-    try:
-        r = redis.Redis(
-            host=get_config('REDIS_HOST'),
-            port=int(get_config('REDIS_PORT', 6379)),
-            password=get_config('REDIS_PASSWORD'),
-            decode_responses=True
-        )
-        r.ping()
-        click.echo(f"✅ VPS Redis: ONLINE")
-    except:
-        click.echo("⚠️  VPS Redis: OFFLINE (local-only mode)")
+        # Local Redis
+        try:
+            msg_count = local.result()
+            click.echo(f"✅ Local Redis: ONLINE ({msg_count} messages)")
+        except Exception:
+            click.echo("❌ Local Redis: OFFLINE")
+
+        # VPS Redis
+        try:
+            vps.result()
+            click.echo(f"✅ VPS Redis: ONLINE")
+        except Exception:
+            click.echo("⚠️  VPS Redis: OFFLINE (local-only mode)")
+
+    # Sync daemon
+    pid = sync_daemon_pid()
+    if pid:
+        click.echo(f"✅ Sync daemon: RUNNING (PID: {pid})")
+    else:
+        click.echo("⚠️  Sync daemon: NOT RUNNING")
 
 if __name__ == '__main__':
     cli()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Bicameral Async Client
+asyncio mirror of BicameralClient for concurrent producers.
+Concurrent send() coroutines share one connection pool, so the driver
+overlaps their round-trips instead of blocking a thread per message.
+"""
+import asyncio
+import inspect
+import socket
+
+import orjson
+import redis.asyncio as aioredis
+
+from .client import (
+    KEEPALIVE_OPTIONS,
+    SEND_LUA,
+    STREAM_KEY,
+    logger,
+    _ChannelCache,
+    _build_payload,
+    _configure_logging,
+    _collect_ids,
+    _hosts_to_try,
+    _needs_script_load,
+    _queue_send,
+    _save_to_fallback,
+)
+
+
+async def _run_send(r, channels, payloads):
+    """Async twin of client._run_send"""
+    for attempt in range(2):
+        pipe = r.pipeline(transaction=False)
+        for payload in payloads:
+            _queue_send(pipe, channels, payload)
+        replies = await pipe.execute(raise_on_error=False)
+
+        if not _needs_script_load(replies):
+            break
+        await r.script_load(SEND_LUA)
+    return replies
+
+
+class AsyncBicameralClient:
+    """Async client for Bicameral communication
+
+    Usage:
+        client = await AsyncBicameralClient.create('claude')
+        await client.send(to_agent='gemini', content='Hello!')
+    """
+
+    def __init__(self, agent_name='unknown'):
+        _configure_logging()
+        self.agent_name = agent_name
+        self._channels = _ChannelCache(agent_name)
+        self._accept = frozenset((agent_name, 'all'))
+        self.redis = None
+
+    @classmethod
+    async def create(cls, agent_name='unknown'):
+        """Build a client and connect it"""
+        client = cls(agent_name)
+        client.redis = await client._connect_redis()
+        return client
+
+    async def _connect_redis(self):
+        """Connect to Redis with automatic fallback (LOCAL FIRST)"""
+        for host, port, password, description in _hosts_to_try():
+            if port is None:
+                # UNIX socket path
+                r = aioredis.Redis(
+                    unix_socket_path=host,
+                    password=password,
+                    socket_connect_timeout=3,
+                    decode_responses=False
+                )
+            else:
+                r = aioredis.Redis(
+                    host=host,
+                    port=port,
+                    password=password,
+                    socket_connect_timeout=3,
+                    socket_keepalive=True,
+                    socket_keepalive_options=KEEPALIVE_OPTIONS,
+                    single_connection_client=False,
+                    decode_responses=False
+                )
+            try:
+                await r.ping()
+                where = host if port is None else f'{host}:{port}'
+                logger.info(f"✅ Connected to Redis: {description} ({where})")
+                return r
+            except Exception as e:
+                logger.warning(f"Failed to connect to {description}: {e}")
+                await r.aclose()
+                continue
+
+        logger.error("❌ Could not connect to any Redis instance")
+        raise ConnectionError("No Redis available. Check VPS/Tailscale connection.")
+
+    async def send(self, to_agent='all', message_type='message', content=''):
+        """Send a message via Redis Streams"""
+        payload = _build_payload(self.agent_name, to_agent, message_type, content)
+
+        try:
+            replies = await _run_send(self.redis, self._channels, [payload])
+            msg_id, = _collect_ids(replies, [payload])
+            if msg_id is None:
+                return None
+
+            logger.info(f"✅ Sent [{message_type}] to {to_agent}: {content[:50]}...")
+            return msg_id
+
+        except Exception as e:
+            logger.error(f"❌ Failed to send message: {e}")
+            _save_to_fallback(payload)
+            return None
+
+    async def send_many(self, messages):
+        """Send several messages in one pipelined round-trip"""
+        payloads = [_build_payload(self.agent_name,
+                                   m.get('to_agent', 'all'),
+                                   m.get('message_type', 'message'),
+                                   m.get('content', ''))
+                    for m in messages]
+        if not payloads:
+            return []
+
+        try:
+            replies = await _run_send(self.redis, self._channels, payloads)
+            msg_ids = _collect_ids(replies, payloads)
+
+            logger.info(f"✅ Sent {len(msg_ids)} messages in one batch")
+            return msg_ids
+
+        except Exception as e:
+            logger.error(f"❌ Failed to send batch of {len(payloads)} messages: {e}")
+            for payload in payloads:
+                _save_to_fallback(payload)
+            return [None] * len(payloads)
+
+    async def _ensure_group(self, last_id='$'):
+        """Async twin of BicameralClient._ensure_group"""
+        try:
+            await self.redis.xgroup_create(STREAM_KEY, self.agent_name, id=last_id, mkstream=True)
+        except aioredis.ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    async def listen(self, callback, last_id='$'):
+        """Listen for new messages; callback may be a function or coroutine
+
+        Same consumer group as BicameralClient.listen(): progress survives
+        restarts, and unacked entries are redelivered first on the next
+        start. last_id only applies when the group is created.
+        """
+        logger.info(f"👂 Listening for messages to {self.agent_name}...")
+        group = self.agent_name
+        consumer = f'{self.agent_name}@{socket.gethostname()}'
+        accept = self._accept
+        await self._ensure_group(last_id)
+        pending = True  # drain our unacked entries ('0') before new ones
+
+        while True:
+            try:
+                resp = await self.redis.xreadgroup(group, consumer,
+                                                   {STREAM_KEY: '0' if pending else '>'},
+                                                   count=100, block=None if pending else 5000)
+                if pending and not (resp and resp[0][1]):
+                    pending = False
+
+                for stream_name, entries in resp or []:
+                    ack_ids = []
+                    for entry_id, data in entries:
+                        if data is None:
+                            # Pending entry trimmed from the stream
+                            ack_ids.append(entry_id)
+                            continue
+
+                        try:
+                            payload = orjson.loads(data.get(b'payload', b'{}'))
+                        except orjson.JSONDecodeError:
+                            logger.warning(f"Failed to parse message: {data}")
+                        else:
+                            if payload.get('to', 'all') in accept \
+                                    and payload.get('from') != self.agent_name:
+                                result = callback(payload)
+                                if inspect.isawaitable(result):
+                                    await result
+
+                        ack_ids.append(entry_id)
+
+                    if ack_ids:
+                        await self.redis.xack(STREAM_KEY, group, *ack_ids)
+
+            except aioredis.ConnectionError:
+                logger.error("❌ Connection lost, reconnecting...")
+                self.redis = await self._connect_redis()
+                await self._ensure_group(last_id)
+                pending = True
+            except aioredis.ResponseError as e:
+                if 'NOGROUP' not in str(e):
+                    raise
+                # Stream or group was removed (or we failed over to another server)
+                await self._ensure_group(last_id)
+                pending = True
+
+    async def get_history(self, count=50):
+        """Get recent message history"""
+        try:
+            entries = await self.redis.xrevrange(STREAM_KEY, count=count)
+        except Exception as e:
+            logger.error(f"Failed to get history: {e}")
+            return []
+
+        messages = []
+        for stream_id, data in entries:
+            try:
+                payload = orjson.loads(data.get(b'payload', b'{}'))
+            except orjson.JSONDecodeError:
+                continue
+            payload['stream_id'] = stream_id.decode()
+            messages.append(payload)
+        return messages
+
+    async def close(self):
+        """Close the connection pool"""
+        if self.redis is not None:
+            await self.redis.aclose()
+
+
+def run(coro):
+    """Run a coroutine, on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    return uvloop.run(coro)
@@ -5,20 +5,31 @@ Works everywhere - local, remote, VPS, doesn't matter.
 One API, automatic failover, bulletproof.
 """
 import redis
-import json
+import orjson
 import os
 import sys
+import time
+import socket
+import queue
 import uuid
+import hashlib
+import functools
+import atexit
+import itertools
 import logging
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from dotenv import load_dotenv
+from redis.backoff import ExponentialBackoff
+from redis.cache import CacheConfig
+from redis.retry import Retry
 
-# Load unified config (override=True ensures our config takes precedence)
-CONFIG_FILE = Path.home() / '.bicameral' / '.env'
-if CONFIG_FILE.exists():
-    load_dotenv(CONFIG_FILE, override=True)
-else:
+from .config import CONFIG_FILE, load_env
+
+# Load unified config (once per process, shared with the other modules)
+load_env()
+if not CONFIG_FILE.exists():
     print(f"⚠️  Config file not found: {CONFIG_FILE}")
     print("Run setup first or create ~/.bicameral/.env")
 
@@ -28,53 +39,324 @@ REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
 REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', 'bicameral_vps_secret')
 STREAM_KEY = os.getenv('STREAM_KEY', 'bicameral:stream:collab')
 
-# Logging
+# Logging (configured on first client use, not at import)
 LOG_FILE = Path.home() / '.bicameral' / 'client.log'
-LOG_FILE.parent.mkdir(exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
+_logging_configured = False
+
+
+def _configure_logging():
+    """Log to ~/.bicameral/client.log and the console"""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
+    LOG_FILE.parent.mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(LOG_FILE),
+            logging.StreamHandler()
+        ]
+    )
+
+
 logger = logging.getLogger(__name__)
 
+# Probe dead links within ~1 min instead of the OS default (often 2 h).
+# Not every platform exposes all three options (macOS lacks TCP_KEEPIDLE
+# on older Pythons), so only set the ones available. redis-py already
+# sets TCP_NODELAY on every connection it opens.
+KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (('TCP_KEEPIDLE', 30), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 3))
+    if hasattr(socket, name)
+}
+
+# Ride out a dropped socket or server restart (0.1s, 0.2s backoff) before
+# failing over; each connection gets its own copy of this policy
+RETRY = Retry(ExponentialBackoff(cap=1.0, base=0.1), 2)
+
+# Connection pools shared by every client in the process, keyed by
+# (host, port, password, cached) so repeat clients reuse warm, authenticated sockets
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(host, port, password, cached=False):
+    """Return the shared connection pool for a Redis endpoint
+
+    A port of None means host is a UNIX socket path. cached=True gives a
+    separate RESP3 pool with client-side caching, shared by every reader
+    for that endpoint.
+    """
+    key = (host, port, password, cached)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is not None:
+            return pool
+
+        options = {'protocol': 3, 'cache_config': CacheConfig()} if cached else {}
+        if port is None:
+            pool = _POOLS[key] = redis.ConnectionPool(
+                connection_class=redis.UnixDomainSocketConnection,
+                path=host,
+                password=password,
+                max_connections=32,
+                socket_connect_timeout=3,
+                retry=RETRY,
+                decode_responses=False,
+                **options
+            )
+        else:
+            pool = _POOLS[key] = redis.ConnectionPool(
+                host=host,
+                port=port,
+                password=password,
+                max_connections=32,
+                socket_connect_timeout=3,
+                socket_keepalive=True,
+                socket_keepalive_options=KEEPALIVE_OPTIONS,
+                retry=RETRY,
+                decode_responses=False,
+                **options
+            )
+        return pool
+
+
+def _hosts_to_try():
+    """Redis endpoints in LOCAL FIRST order, fallback to VPS"""
+    # This ensures work continues even if VPS is down
+    LOCAL_HOST = os.getenv('LOCAL_REDIS_HOST', 'localhost')
+    LOCAL_PORT = int(os.getenv('LOCAL_REDIS_PORT', '6379'))
+    LOCAL_PASSWORD = os.getenv('LOCAL_REDIS_PASSWORD', 'bicameral_secret_local')
+    LOCAL_SOCKET = os.getenv('LOCAL_REDIS_SOCKET')
+
+    hosts = [
+        (LOCAL_HOST, LOCAL_PORT, LOCAL_PASSWORD, 'Local Redis (PRIMARY)'),
+        (REDIS_HOST, REDIS_PORT, REDIS_PASSWORD, 'VPS via Tailscale (FALLBACK)'),
+    ]
+    if LOCAL_SOCKET:
+        # UNIX socket skips the loopback TCP stack; TCP stays as fallback
+        hosts.insert(0, (os.path.expanduser(LOCAL_SOCKET), None, LOCAL_PASSWORD,
+                         'Local Redis via UNIX socket (PRIMARY)'))
+    return hosts
+
+
+# Message ids: a random per-process prefix (unique across hosts), the pid
+# (unique across forks) and a counter - far cheaper than uuid4() per message
+_ID_PREFIX = uuid.uuid4().hex[:12]
+_ID_COUNTER = itertools.count()
+
+
+def _build_payload(agent_name, to_agent, message_type, content):
+    """Build the message payload shared by stream and pub/sub"""
+    return {
+        'id': f'{_ID_PREFIX}-{os.getpid():x}-{next(_ID_COUNTER):x}',
+        'timestamp': datetime.now().isoformat(),
+        'from': agent_name,
+        'to': to_agent,
+        'type': message_type,
+        'message': content
+    }
+
+
+# Atomic send: XADD to the stream plus both publishes, one request and
+# one reply. KEYS = stream, broadcast channel, agent channel; ARGV = body.
+SEND_LUA = """
+local id = redis.call('XADD', KEYS[1], '*', 'payload', ARGV[1])
+redis.call('PUBLISH', KEYS[2], ARGV[1])
+redis.call('PUBLISH', KEYS[3], ARGV[1])
+return id
+"""
+SEND_SHA = hashlib.sha1(SEND_LUA.encode()).hexdigest()
+
+
+class _ChannelCache(dict):
+    """to_agent -> '<agent>:to_<to_agent>' channel names, built once each"""
+
+    def __init__(self, agent_name):
+        super().__init__()
+        self.agent_name = agent_name
+
+    def __missing__(self, to_agent):
+        channel = self[to_agent] = f'{self.agent_name}:to_{to_agent}'
+        return channel
+
+
+def _queue_send(pipe, channels, payload):
+    """Queue the send script for one payload
+
+    Works for both sync and asyncio pipelines (queueing never awaits).
+    """
+    # 1. Persistent stream (PERSISTENCE)
+    # 2. Global broadcast channel (for monitors, instant listeners)
+    # 3. Agent-specific channel (for targeted listeners)
+    pipe.evalsha(SEND_SHA, 3,
+                 STREAM_KEY, 'bicameral:realtime', channels[payload['to']],
+                 orjson.dumps(payload))
+
+
+def _needs_script_load(replies):
+    """True if the server did not have the send script cached"""
+    return bool(replies) and isinstance(replies[0], redis.exceptions.NoScriptError)
+
+
+def _run_send(r, channels, payloads):
+    """Run the send script for every payload in one pipelined round-trip
+
+    The script is loaded on demand (first use on a server, or after a
+    restart/failover) and the batch retried once.
+    """
+    for attempt in range(2):
+        pipe = r.pipeline(transaction=False)
+        for payload in payloads:
+            _queue_send(pipe, channels, payload)
+        replies = pipe.execute(raise_on_error=False)
+
+        if not _needs_script_load(replies):
+            break
+        r.script_load(SEND_LUA)
+    return replies
+
+
+def _collect_ids(replies, payloads):
+    """Map send script replies to stream IDs
+
+    Payloads whose script call failed are saved to the disk fallback and
+    get None. Connections don't decode responses, so IDs are decoded here,
+    only for the values handed back to callers.
+    """
+    msg_ids = []
+    for payload, msg_id in zip(payloads, replies):
+        if isinstance(msg_id, Exception):
+            logger.error(f"❌ Failed to store message {payload['id']}: {msg_id}")
+            _save_to_fallback(payload)
+            msg_id = None
+        else:
+            msg_id = msg_id.decode()
+        msg_ids.append(msg_id)
+    return msg_ids
+
+
+# Failed messages are appended to disk by a background writer so send()
+# never blocks on file I/O
+FALLBACK_FILE = Path.home() / '.bicameral' / 'failed_messages.jsonl'
+_FALLBACK_Q = queue.Queue(maxsize=10_000)
+_FALLBACK_BATCH = 128
+_FALLBACK_FSYNC_INTERVAL = 0.1  # seconds
+_fallback_thread = None
+_fallback_lock = threading.Lock()
+
+
+def _fallback_writer():
+    """Drain the fallback queue into failed_messages.jsonl
+
+    Errors are handled per batch: a failed open or write (missing dir,
+    disk full) is logged and the file reopened for the next batch, so the
+    writer never stops for good.
+    """
+    last_fsync = 0.0
+    f = None
+    while True:
+        batch = [_FALLBACK_Q.get()]
+        try:
+            while len(batch) < _FALLBACK_BATCH:
+                batch.append(_FALLBACK_Q.get_nowait())
+        except queue.Empty:
+            pass
+
+        try:
+            if f is None:
+                FALLBACK_FILE.parent.mkdir(parents=True, exist_ok=True)
+                f = open(FALLBACK_FILE, 'ab', buffering=1 << 16)
+            f.writelines(batch)
+            f.flush()
+            now = time.monotonic()
+            if now - last_fsync >= _FALLBACK_FSYNC_INTERVAL:
+                os.fsync(f.fileno())
+                last_fsync = now
+        except OSError as e:
+            logger.error(f"Failed to save {len(batch)} fallback messages: {e}")
+            if f is not None:
+                try:
+                    f.close()
+                except OSError:
+                    pass
+                f = None
+        finally:
+            for _ in batch:
+                _FALLBACK_Q.task_done()
+
+
+def _drain_fallback(timeout=2.0):
+    """Give the fallback writer a chance to finish before exit"""
+    deadline = time.monotonic() + timeout
+    while _FALLBACK_Q.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+atexit.register(_drain_fallback)
+
+
+def _save_to_fallback(payload):
+    """Queue a failed message for the disk fallback (non-blocking)"""
+    global _fallback_thread
+    with _fallback_lock:
+        if _fallback_thread is None or not _fallback_thread.is_alive():
+            _fallback_thread = threading.Thread(target=_fallback_writer, daemon=True)
+            _fallback_thread.start()
+
+    try:
+        _FALLBACK_Q.put_nowait(orjson.dumps(payload) + b'\n')
+        logger.warning(f"💾 Message queued for fallback: {FALLBACK_FILE}")
+    except queue.Full:
+        logger.error(f"Failed to save fallback: queue full, dropped {payload['id']}")
+
+
+# Delivered message IDs listen_realtime() remembers to de-dupe replays
+_REALTIME_SEEN_MAX = 10_000
+# Stream entries fetched per XRANGE when listen_realtime() catches up
+_REPLAY_PAGE = 500
+
 
 class BicameralClient:
     """Unified client for all Bicameral communication"""
 
-    def __init__(self, agent_name='unknown'):
+    def __init__(self, agent_name='unknown', batch_size=50, flush_ms=None):
+        _configure_logging()
         self.agent_name = agent_name
+        self._channels = _ChannelCache(agent_name)
+        self._accept = frozenset((agent_name, 'all'))
         self.redis = self._connect_redis()
+        self._reader = None
+        self._reader_for = None
+
+        # Optional auto-flush: send() queues payloads and a background
+        # thread drains them through send_many() in batches.
+        self.batch_size = batch_size
+        self.flush_ms = flush_ms
+        self._queue = None
+        if flush_ms is not None:
+            self._queue = deque()
+            self._wake = threading.Event()
+            self._flush_lock = threading.Lock()  # one drainer at a time
+            self._closed = False
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+            atexit.register(self.close)
 
     def _connect_redis(self):
         """Connect to Redis with automatic fallback"""
 
         # LOCAL FIRST strategy: Try local Redis first, fallback to VPS
-        # This ensures work continues even if VPS is down
-        LOCAL_HOST = os.getenv('LOCAL_REDIS_HOST', 'localhost')
-        LOCAL_PORT = int(os.getenv('LOCAL_REDIS_PORT', '6379'))
-        LOCAL_PASSWORD = os.getenv('LOCAL_REDIS_PASSWORD', 'bicameral_secret_local')
-
-        hosts_to_try = [
-            (LOCAL_HOST, LOCAL_PORT, LOCAL_PASSWORD, 'Local Redis (PRIMARY)'),
-            (REDIS_HOST, REDIS_PORT, REDIS_PASSWORD, 'VPS via Tailscale (FALLBACK)'),
-        ]
-
-        for host, port, password, description in hosts_to_try:
+        for host, port, password, description in _hosts_to_try():
             try:
-                r = redis.Redis(
-                    host=host,
-                    port=port,
-                    password=password,
-                    socket_connect_timeout=3,
-                    socket_keepalive=True,
-                    decode_responses=True
-                )
+                r = redis.Redis(connection_pool=_get_pool(host, port, password))
                 r.ping()
-                logger.info(f"✅ Connected to Redis: {description} ({host}:{port})")
+                where = host if port is None else f'{host}:{port}'
+                logger.info(f"✅ Connected to Redis: {description} ({where})")
                 print(f"✅ Connected: {description}")
                 return r
             except Exception as e:
@@ -85,91 +367,320 @@ class BicameralClient:
         raise ConnectionError("No Redis available. Check VPS/Tailscale connection.")
 
     def send(self, to_agent='all', message_type='message', content=''):
-        """Send a message via Redis Streams"""
-
-        payload = {
-            'id': str(uuid.uuid4()),
-            'timestamp': datetime.now().isoformat(),
-            'from': self.agent_name,
-            'to': to_agent,
-            'type': message_type,
-            'message': content
-        }
+        """Send a message via Redis Streams
+
+        With auto-flush enabled (flush_ms) the message is queued and None is
+        returned; it is written by the background flusher. After close() it
+        is sent directly.
+        """
+
+        payload = _build_payload(self.agent_name, to_agent, message_type, content)
+
+        if self._queue is not None and not self._closed:
+            self._queue.append(payload)
+            if self._closed:
+                # close() may have drained the queue already; don't strand it
+                self.flush()
+            elif len(self._queue) >= self.batch_size:
+                self._wake.set()
+            return None
 
         try:
-            # Store in persistent stream (PERSISTENCE)
-            msg_id = self.redis.xadd(STREAM_KEY, {'payload': json.dumps(payload)})
-
-            # Publish to multiple channels for INSTANT notifications
-            # 1. Global broadcast channel (for monitors, instant listeners)
-            self.redis.publish('bicameral:realtime', json.dumps(payload))
-
-            # 2. Agent-specific channel (for targeted listeners)
-            channel = f'{self.agent_name}:to_{to_agent}'
-            self.redis.publish(channel, json.dumps(payload))
+            # Stream write and both publishes in a single round-trip
+            replies = _run_send(self.redis, self._channels, [payload])
+            msg_id, = _collect_ids(replies, [payload])
+            if msg_id is None:
+                return None
 
             logger.info(f"✅ Sent [{message_type}] to {to_agent}: {content[:50]}...")
             logger.debug(f"   Stream ID: {msg_id}")
-            logger.debug(f"   Published to: bicameral:realtime, {channel}")
+            logger.debug(f"   Published to: bicameral:realtime, {self._channels[to_agent]}")
             return msg_id
 
         except Exception as e:
             logger.error(f"❌ Failed to send message: {e}")
-            self._save_to_fallback(payload)
+            _save_to_fallback(payload)
             return None
 
+    def send_many(self, messages):
+        """Send several messages in one pipelined round-trip
+
+        Args:
+            messages: List of dicts with send() keyword arguments
+                      (to_agent, message_type, content)
+
+        Returns:
+            List of stream IDs (None for each message on failure)
+        """
+        payloads = [_build_payload(self.agent_name,
+                                   m.get('to_agent', 'all'),
+                                   m.get('message_type', 'message'),
+                                   m.get('content', ''))
+                    for m in messages]
+        return self._send_payloads(payloads)
+
+    def _send_payloads(self, payloads):
+        """Write prebuilt payloads with a single pipeline execute"""
+        if not payloads:
+            return []
+
+        try:
+            replies = _run_send(self.redis, self._channels, payloads)
+            msg_ids = _collect_ids(replies, payloads)
+
+            logger.info(f"✅ Sent {len(msg_ids)} messages in one batch")
+            return msg_ids
+
+        except Exception as e:
+            logger.error(f"❌ Failed to send batch of {len(payloads)} messages: {e}")
+            for payload in payloads:
+                _save_to_fallback(payload)
+            return [None] * len(payloads)
+
+    def flush(self):
+        """Drain queued messages (auto-flush mode) in batches"""
+        if self._queue is None:
+            return
+
+        # Serialized with the background flusher, so the emptiness check
+        # and popleft() can't race and batches go out in order
+        with self._flush_lock:
+            while self._queue:
+                batch = []
+                while self._queue and len(batch) < self.batch_size:
+                    batch.append(self._queue.popleft())
+                self._send_payloads(batch)
+
+    def close(self):
+        """Stop the background flusher and send anything still queued"""
+        if self._queue is None or self._closed:
+            return
+
+        self._closed = True
+        atexit.unregister(self.close)  # don't pin this client until exit
+        self._wake.set()
+        self._flusher.join(timeout=5)
+        self.flush()
+
+    def _flush_loop(self):
+        """Background flusher: wake on a full batch or every flush_ms"""
+        interval = self.flush_ms / 1000
+        while not self._closed:
+            self._wake.wait(interval)
+            self._wake.clear()
+            self.flush()
+
+    def _ensure_group(self, last_id='$'):
+        """Create this agent's consumer group if it does not exist yet"""
+        try:
+            self.redis.xgroup_create(STREAM_KEY, self.agent_name, id=last_id, mkstream=True)
+        except redis.ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
     def listen(self, callback, last_id='$'):
-        """Listen for new messages in real-time"""
+        """Listen for new messages in real-time
+
+        Reads through a consumer group named after this agent, so progress
+        survives restarts. last_id only applies when the group is created.
+        Entries delivered but not acked (crash, interrupt, callback error)
+        are redelivered first on the next start.
+        """
 
         logger.info(f"👂 Listening for messages to {self.agent_name}...")
-        current_id = last_id
+        group = self.agent_name
+        # Stable per host, so a restart picks up its own pending entries
+        consumer = f'{self.agent_name}@{socket.gethostname()}'
+        accept = self._accept
+        self._ensure_group(last_id)
+        pending = True  # drain our unacked entries ('0') before new ones
 
         try:
             while True:
                 try:
-                    # Block for 1 second waiting for new messages
-                    resp = self.redis.xread({STREAM_KEY: current_id}, count=10, block=1000)
+                    resp = self.redis.xreadgroup(group, consumer,
+                                                 {STREAM_KEY: '0' if pending else '>'},
+                                                 count=100, block=None if pending else 5000)
+                    if pending and not (resp and resp[0][1]):
+                        pending = False
+
+                    for stream_name, entries in resp or []:
+                        ack_ids = []
+
+                        for entry_id, data in entries:
+                            if data is None:
+                                # Pending entry trimmed from the stream
+                                ack_ids.append(entry_id)
+                                continue
 
-                    if resp:
-                        for stream_name, entries in resp:
-                            for entry in entries:
-                                current_id = entry[0]
-                                data = entry[1]
+                            # Parse payload
+                            try:
+                                payload = orjson.loads(data.get(b'payload', b'{}'))
 
-                                # Parse payload
-                                try:
-                                    payload = json.loads(data.get('payload', '{}'))
+                                # Only messages for this agent (or all), never our own
+                                if payload.get('to', 'all') in accept \
+                                        and payload.get('from') != self.agent_name:
+                                    callback(payload)
 
-                                    # Filter messages not for this agent
-                                    to_agent = payload.get('to', 'all')
-                                    from_agent = payload.get('from', 'unknown')
+                            except orjson.JSONDecodeError:
+                                logger.warning(f"Failed to parse message: {data}")
 
-                                    if to_agent == 'all' or to_agent == self.agent_name:
-                                        # Don't process own messages
-                                        if from_agent != self.agent_name:
-                                            callback(payload)
+                            ack_ids.append(entry_id)
 
-                                except json.JSONDecodeError:
-                                    logger.warning(f"Failed to parse message: {data}")
+                        # One XACK for the whole batch
+                        if ack_ids:
+                            self.redis.xack(STREAM_KEY, group, *ack_ids)
 
                 except redis.ConnectionError:
                     logger.error("❌ Connection lost, reconnecting...")
                     self.redis = self._connect_redis()
+                    self._ensure_group(last_id)
+                    pending = True
+                except redis.ResponseError as e:
+                    if 'NOGROUP' not in str(e):
+                        raise
+                    # Stream or group was removed (or we failed over to another server)
+                    self._ensure_group(last_id)
+                    pending = True
 
         except KeyboardInterrupt:
             logger.info("🛑 Listener stopped")
 
+    def lag(self):
+        """Entries not yet delivered to this agent's consumer group
+
+        Uses the `lag` field of XINFO GROUPS (Redis 7+); returns None when
+        the server does not report it or the group does not exist.
+        """
+        try:
+            for group in self.redis.xinfo_groups(STREAM_KEY):
+                if group['name'] == self.agent_name.encode():
+                    return group.get('lag')
+        except redis.ResponseError:
+            pass
+        return None
+
+    def listen_realtime(self, callback, last_id=None):
+        """Listen via Pub/Sub for instant, push-based delivery
+
+        If last_id is given, stream entries after it are replayed first so
+        nothing sent while this agent was offline is missed. Otherwise the
+        stream tip at the first subscribe is used, so only reconnects
+        catch up on what was published during the outage.
+        """
+
+        logger.info(f"👂 Listening (Pub/Sub) for messages to {self.agent_name}...")
+
+        accept = self._accept
+        # IDs already delivered, kept across reconnects so the replay after
+        # a reconnect skips what pub/sub already pushed (bounded)
+        seen = set()
+        seen_order = deque()
+
+        def deliver(payload):
+            msg_id = payload.get('id')
+            if msg_id is not None:
+                if msg_id in seen:
+                    return
+                seen.add(msg_id)
+                seen_order.append(msg_id)
+                if len(seen_order) > _REALTIME_SEEN_MAX:
+                    seen.discard(seen_order.popleft())
+
+            if payload.get('to', 'all') in accept \
+                    and payload.get('from') != self.agent_name:
+                callback(payload)
+
+        pubsub = None
+        try:
+            while True:
+                try:
+                    if pubsub is not None:
+                        pubsub.close()
+                    # Subscribe before replaying so nothing falls in the gap
+                    pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe('bicameral:realtime')
+
+                    if last_id is None:
+                        tip = self.redis.xrevrange(STREAM_KEY, count=1)
+                        last_id = tip[0][0].decode() if tip else '0-0'
+
+                    # Replay in pages so a long outage isn't loaded at once
+                    while True:
+                        entries = self.redis.xrange(STREAM_KEY, min=f'({last_id}',
+                                                    count=_REPLAY_PAGE)
+                        for stream_id, data in entries:
+                            last_id = stream_id.decode()
+                            try:
+                                payload = orjson.loads(data.get(b'payload', b'{}'))
+                            except orjson.JSONDecodeError:
+                                continue
+                            deliver(payload)
+                        if len(entries) < _REPLAY_PAGE:
+                            break
+
+                    for message in pubsub.listen():
+                        try:
+                            payload = orjson.loads(message['data'])
+                        except orjson.JSONDecodeError:
+                            logger.warning(f"Failed to parse message: {message['data']}")
+                            continue
+                        deliver(payload)
+
+                except redis.ConnectionError:
+                    logger.error("❌ Connection lost, reconnecting...")
+                    self.redis = self._connect_redis()
+
+        except KeyboardInterrupt:
+            logger.info("🛑 Listener stopped")
+        finally:
+            if pubsub is not None:
+                pubsub.close()
+
+    def _get_reader(self):
+        """Connection for repeated reads (history, stream length)
+
+        Uses RESP3 with client-side caching: results are served locally
+        until the server pushes an invalidation for the stream. Falls back
+        to the regular connection on servers without RESP3 support.
+        """
+        if self._reader_for is not self.redis:
+            if self._reader is not None and self._reader is not self._reader_for:
+                self._reader.close()
+
+            kwargs = self.redis.connection_pool.connection_kwargs
+            if 'path' in kwargs:
+                endpoint = (kwargs['path'], None)
+            else:
+                endpoint = (kwargs.get('host', 'localhost'), kwargs.get('port', 6379))
+            try:
+                # Pooled, so the RESP3 handshake and the cache are shared
+                # by every client in the process
+                reader = redis.Redis(connection_pool=_get_pool(
+                    *endpoint, kwargs.get('password'), cached=True))
+                reader.ping()
+            except Exception as e:
+                logger.debug(f"Client-side caching unavailable: {e}")
+                reader = self.redis
+            self._reader = reader
+            self._reader_for = self.redis
+        return self._reader
+
+    def stream_length(self):
+        """Number of messages in the stream (cached until it changes)"""
+        return self._get_reader().xlen(STREAM_KEY)
+
     def get_history(self, count=50):
         """Get recent message history"""
         try:
-            entries = self.redis.xrevrange(STREAM_KEY, count=count)
+            entries = self._get_reader().xrevrange(STREAM_KEY, count=count)
             messages = []
 
             for entry in entries:
                 stream_id, data = entry
                 try:
-                    payload = json.loads(data.get('payload', '{}'))
-                    payload['stream_id'] = stream_id
+                    payload = orjson.loads(data.get(b'payload', b'{}'))
+                    payload['stream_id'] = stream_id.decode()
                     messages.append(payload)
                 except:
                     continue
@@ -180,21 +691,17 @@ class BicameralClient:
             logger.error(f"Failed to get history: {e}")
             return []
 
-    def _save_to_fallback(self, payload):
-        """Save failed message to disk"""
-        fallback_file = Path.home() / '.bicameral' / 'failed_messages.jsonl'
-        try:
-            with open(fallback_file, 'a') as f:
-                f.write(json.dumps(payload) + '\n')
-            logger.warning(f"💾 Message saved to fallback: {fallback_file}")
-        except Exception as e:
-            logger.error(f"Failed to save fallback: {e}")
+
+@functools.lru_cache(maxsize=8)
+def _get_client(agent_name):
+    """Client reused across send() calls for the same agent"""
+    return BicameralClient(agent_name=agent_name)
 
 
 # Convenience function for quick sends
 def send(from_agent, message_type, content, to_agent='all'):
     """Quick send without creating client instance"""
-    client = BicameralClient(agent_name=from_agent)
+    client = _get_client(from_agent)
     return client.send(to_agent=to_agent, message_type=message_type, content=content)
 
 
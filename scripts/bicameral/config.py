@@ -2,17 +2,54 @@
 Configuration management with 1Password integration
 """
 import os
+import shutil
 import subprocess
+import functools
 from pathlib import Path
-from dotenv import load_dotenv
 
 CONFIG_FILE = Path.home() / '.bicameral' / '.env'
 
-def load_config(use_1password=True):
-    """Load configuration, optionally using 1Password CLI"""
+# Set once the config has been applied to os.environ in this process
+_LOADED = False
+
+# Set once load_env() has applied the plain .env file in this process
+_ENV_LOADED = False
+
+# Injected env vars from `op inject`, keyed by config file (mtime, size)
+_INJECTED = {}
+
+def load_env():
+    """Apply the .env file to os.environ, once per process
+
+    Import-time counterpart of load_config() shared by the client, listener,
+    monitor and sync modules: plain dotenv, no 1Password, and a missing file
+    is not an error. Skipped if load_config() already ran, so secrets it
+    injected are not overwritten with op:// references.
+    """
+    global _ENV_LOADED
+    if _LOADED or _ENV_LOADED or not CONFIG_FILE.exists():
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(CONFIG_FILE, override=True)
+    _ENV_LOADED = True
+
+def load_config(use_1password=True, force=False):
+    """Load configuration, optionally using 1Password CLI
+
+    Repeated calls in the same process are no-ops; pass force=True to
+    re-read the config file.
+    """
+    global _LOADED
+    if _LOADED and not force:
+        return
+
     if not CONFIG_FILE.exists():
         raise FileNotFoundError(f"Config file not found: {CONFIG_FILE}")
 
+    from dotenv import load_dotenv
+
     if use_1password and is_1password_available():
         # Use 1Password CLI to inject secrets
         load_config_with_1password()
@@ -20,8 +57,22 @@ def load_config(use_1password=True):
         # Standard dotenv loading
         load_dotenv(CONFIG_FILE, override=True)
 
+    _LOADED = True
+
+@functools.lru_cache(maxsize=1)
 def is_1password_available():
-    """Check if 1Password CLI is installed and authenticated"""
+    """Check if 1Password CLI is installed and authenticated
+
+    Probed once per process. Set BICAMERAL_SKIP_1PASSWORD=1 to skip the
+    probe entirely.
+    """
+    if os.getenv('BICAMERAL_SKIP_1PASSWORD') == '1':
+        return False
+
+    # PATH lookup is a few stat() calls; skip the fork when op isn't installed
+    if shutil.which('op') is None:
+        return False
+
     try:
         result = subprocess.run(['op', 'account', 'get'],
                               capture_output=True, timeout=2)
@@ -31,28 +82,40 @@ def is_1password_available():
 
 def load_config_with_1password():
     """Load config using 1Password CLI secret injection"""
+    from dotenv import load_dotenv
+
     try:
-        # Read .env file with op:// references
-        with open(CONFIG_FILE, 'r') as f:
-            env_content = f.read()
-
-        # Inject secrets using op CLI
-        result = subprocess.run(
-            ['op', 'inject'],
-            input=env_content.encode(),
-            capture_output=True,
-            timeout=10
-        )
-
-        if result.returncode == 0:
+        stat = CONFIG_FILE.stat()
+        cache_key = (stat.st_mtime, stat.st_size)
+        env_vars = _INJECTED.get(cache_key)
+
+        if env_vars is None:
+            # Read .env file with op:// references (raw bytes straight to op)
+            env_content = CONFIG_FILE.read_bytes()
+
+            # Inject secrets using op CLI
+            result = subprocess.run(
+                ['op', 'inject'],
+                input=env_content,
+                capture_output=True,
+                timeout=10
+            )
+
+            if result.returncode != 0:
+                # Fallback to standard loading
+                load_dotenv(CONFIG_FILE, override=True)
+                return
+
             # Parse injected env vars
+            env_vars = {}
             for line in result.stdout.decode().split('\n'):
                 if '=' in line and not line.startswith('#'):
                     key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
-        else:
-            # Fallback to standard loading
-            load_dotenv(CONFIG_FILE, override=True)
+                    env_vars[key.strip()] = value.strip()
+            _INJECTED.clear()
+            _INJECTED[cache_key] = env_vars
+
+        os.environ.update(env_vars)
     except Exception:
         # Fallback to standard loading
         load_dotenv(CONFIG_FILE, override=True)
@@ -10,28 +10,42 @@ This is MUCH faster than polling Streams every few seconds!
 """
 import redis
 import json
+import orjson
 import os
+import re
 import sys
+import subprocess
+import threading
+import time
 import logging
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
+
+from .client import _get_pool
+from .config import load_env
 
 # Load config
-CONFIG_FILE = Path.home() / '.bicameral' / '.env'
-load_dotenv(CONFIG_FILE, override=True)
+load_env()
 
-# Configuration
-REDIS_HOST = os.getenv('REDIS_HOST', '100.111.230.6')
-REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
-REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', 'bicameral_vps_secret')
-LOCAL_HOST = os.getenv('LOCAL_REDIS_HOST', 'localhost')
-LOCAL_PORT = int(os.getenv('LOCAL_REDIS_PORT', '6379'))
-LOCAL_PASSWORD = os.getenv('LOCAL_REDIS_PASSWORD', 'bicameral_vps_secret')
+# Configuration (one bound lookup on the environ mapping per key)
+_env = os.environ.get
+REDIS_HOST = _env('REDIS_HOST', '100.111.230.6')
+REDIS_PORT = int(_env('REDIS_PORT', '6379'))
+REDIS_PASSWORD = _env('REDIS_PASSWORD', 'bicameral_vps_secret')
+LOCAL_HOST = _env('LOCAL_REDIS_HOST', 'localhost')
+LOCAL_PORT = int(_env('LOCAL_REDIS_PORT', '6379'))
+LOCAL_PASSWORD = _env('LOCAL_REDIS_PASSWORD', 'bicameral_vps_secret')
 
 # Pub/Sub channels
 PUBSUB_CHANNEL = 'bicameral:realtime'
 
+# Cheap byte-level routing prefilter, run before the full JSON parse.
+# Quotes inside string values are escaped, so these only match real keys.
+_TO_FIELD = re.compile(rb'"to"\s*:\s*"([^"]*)"')
+_FROM_GEMINI = re.compile(rb'"from"\s*:\s*"gemini"')
+_FOR_GEMINI = frozenset((b'gemini', b'all'))
+
 # Logging
 LOG_FILE = Path.home() / '.bicameral' / 'gemini_listener.log'
 LOG_FILE.parent.mkdir(exist_ok=True)
@@ -46,17 +60,56 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def notify_user(title, message):
-    """Send macOS notification"""
+# At most _NOTIFY_BURST notifications per _NOTIFY_WINDOW seconds; a burst
+# beyond that is coalesced into one "N new messages" notification
+_NOTIFY_BURST = 5
+_NOTIFY_WINDOW = 2.0
+_notify_times = deque(maxlen=_NOTIFY_BURST)
+_pending_titles = []
+_notify_lock = threading.Lock()
+
+
+def _post_notification(title, message):
+    """Send macOS notification (fire-and-forget, no shell)"""
     try:
-        safe_title = title.replace('"', '\\"').replace("'", "\\'")
-        safe_message = message.replace('"', '\\"').replace("'", "\\'")[:200]  # Limit length
-        cmd = f'osascript -e \'display notification "{safe_message}" with title "{safe_title}"\''
-        os.system(cmd)
+        # json.dumps yields a double-quoted, escaped string AppleScript accepts
+        script = (f'display notification {json.dumps(message[:200], ensure_ascii=False)} '
+                  f'with title {json.dumps(title, ensure_ascii=False)}')
+        subprocess.Popen(['osascript', '-e', script],
+                         stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL)
     except Exception as e:
         logger.warning(f"Failed to send notification: {e}")
 
 
+def _flush_pending():
+    """Post one notification summarising the coalesced burst"""
+    with _notify_lock:
+        titles = list(dict.fromkeys(_pending_titles))
+        count = len(_pending_titles)
+        _pending_titles.clear()
+        _notify_times.append(time.monotonic())
+
+    if count:
+        _post_notification(f"{count} new messages", '\n'.join(titles))
+
+
+def notify_user(title, message):
+    """Send macOS notification, rate-limited under bursts"""
+    with _notify_lock:
+        now = time.monotonic()
+        if len(_notify_times) == _NOTIFY_BURST and now - _notify_times[0] < _NOTIFY_WINDOW:
+            if not _pending_titles:
+                timer = threading.Timer(_NOTIFY_WINDOW, _flush_pending)
+                timer.daemon = True
+                timer.start()
+            _pending_titles.append(title)
+            return
+        _notify_times.append(now)
+
+    _post_notification(title, message)
+
+
 def connect_redis():
     """Connect to Redis (try local first, then VPS)"""
     hosts_to_try = [
@@ -66,13 +119,8 @@ def connect_redis():
 
     for host, port, password, description in hosts_to_try:
         try:
-            r = redis.Redis(
-                host=host,
-                port=port,
-                password=password,
-                decode_responses=True,
-                socket_connect_timeout=3
-            )
+            # Shared keepalive pool; the ping picks local vs VPS
+            r = redis.Redis(connection_pool=_get_pool(host, port, password))
             r.ping()
             logger.info(f"✅ Connected to {description} ({host}:{port})")
             print(f"✅ Connected to {description}")
@@ -105,8 +153,14 @@ def main():
     try:
         for message in pubsub.listen():
             if message['type'] == 'message':
+                raw = message['data']
+                to_field = _TO_FIELD.search(raw)
+                if (to_field and to_field.group(1) not in _FOR_GEMINI) \
+                        or _FROM_GEMINI.search(raw):
+                    continue
+
                 try:
-                    payload = json.loads(message['data'])
+                    payload = orjson.loads(raw)
                     from_agent = payload.get('from', 'unknown')
                     to_agent = payload.get('to', 'all')
                     msg_type = payload.get('type', 'message')
@@ -117,12 +171,15 @@ def main():
                     if to_agent == 'gemini' or to_agent == 'all':
                         # Don't notify about Gemini's own messages
                         if from_agent != 'gemini':
-                            # Parse timestamp
-                            try:
-                                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                                time_str = dt.strftime('%H:%M:%S')
-                            except:
-                                time_str = timestamp[:8] if timestamp else '??:??:??'
+                            # Parse timestamp (ISO-8601 fast path: slice HH:MM:SS)
+                            if len(timestamp) >= 19 and timestamp[10] == 'T':
+                                time_str = timestamp[11:19]
+                            else:
+                                try:
+                                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                                    time_str = dt.strftime('%H:%M:%S')
+                                except:
+                                    time_str = timestamp[:8] if timestamp else '??:??:??'
 
                             # Print to console
                             print(f"\n[{time_str}] 📨 {from_agent.upper()} → {msg_type.upper()}")
@@ -134,7 +191,7 @@ def main():
                                 f"[{msg_type}] {content[:100]}"
                             )
 
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Failed to parse message: {message['data']}")
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
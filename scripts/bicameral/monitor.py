@@ -6,18 +6,19 @@
 - Real-time updates
 """
 
-import json
+import orjson
 import time
 import sys
 import os
 from datetime import datetime
-from pathlib import Path
 import redis
-from dotenv import load_dotenv
+
+from .client import _get_pool
+from .config import load_env
 
 # Try importing rich
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.panel import Panel
     from rich.text import Text
     from rich.markdown import Markdown
@@ -28,74 +29,69 @@ except ImportError:
     sys.exit(1)
 
 # Load unified config
-CONFIG_FILE = Path.home() / '.bicameral' / '.env'
-if CONFIG_FILE.exists():
-    load_dotenv(CONFIG_FILE, override=True)
+load_env()
 
 # Configuration (from unified config)
 # Use LOCAL Redis for monitoring (where messages are sent)
-REDIS_HOST = os.getenv('LOCAL_REDIS_HOST', 'localhost')
-REDIS_PORT = int(os.getenv('LOCAL_REDIS_PORT', '6379'))
-REDIS_PASSWORD = os.getenv('LOCAL_REDIS_PASSWORD', 'bicameral_secret_local')
-STREAM_KEY = os.getenv('STREAM_KEY', 'bicameral:stream:collab')
+_env = os.environ.get
+REDIS_HOST = _env('LOCAL_REDIS_HOST', 'localhost')
+REDIS_PORT = int(_env('LOCAL_REDIS_PORT', '6379'))
+REDIS_PASSWORD = _env('LOCAL_REDIS_PASSWORD', 'bicameral_secret_local')
+STREAM_KEY = _env('STREAM_KEY', 'bicameral:stream:collab')
 
 def connect_redis():
-    try:
-        r = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            password=REDIS_PASSWORD,
-            decode_responses=True
-        )
-        r.ping()
-        return r
-    except Exception as e:
-        print(f"❌ Failed to connect to Redis: {e}")
-        sys.exit(1)
+    # Shared pool: keepalive notices a dead peer while XREAD blocks.
+    # No ping here - the history load below is the connectivity check.
+    return redis.Redis(connection_pool=_get_pool(REDIS_HOST, REDIS_PORT, REDIS_PASSWORD))
 
 def parse_message(stream_entry):
     try:
         stream_id, data = stream_entry
-        if 'payload' in data:
-            payload = json.loads(data['payload'])
+        if b'payload' in data:
+            payload = orjson.loads(data[b'payload'])
         else:
-            payload = data
-        payload['stream_id'] = stream_id
+            payload = {k.decode(): v.decode() for k, v in data.items()}
+        payload['stream_id'] = stream_id.decode()
         return payload
     except Exception:
         return None
 
-def print_message(console, msg):
-    """Prints a single message panel to the console."""
-    if not msg:
-        return
+# Per-sender (border style, title label)
+_PANEL_STYLES = {
+    "claude": ("magenta", "[magenta]👤 Claude[/]"),
+    "gemini": ("blue", "[blue]🤖 Gemini[/]"),
+    "daemon": ("green", "[green]🧠 Daemon[/]"),
+}
+
+def render_message(msg):
+    """Builds the panel for a single message."""
 
     sender = msg.get('from', 'unknown')
     msg_type = msg.get('type', 'unknown')
     content = msg.get('message', '')
     timestamp = msg.get('timestamp', '')
 
-    try:
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        time_str = dt.strftime("%H:%M:%S")
-    except:
-        time_str = timestamp[:8] if timestamp else "??:??:??"
-
-    if sender == "claude":
-        border_style = "magenta"
-        title = f"[magenta]👤 Claude[/] • {msg_type.upper()}"
-    elif sender == "gemini":
-        border_style = "blue"
-        title = f"[blue]🤖 Gemini[/] • {msg_type.upper()}"
-    elif sender == "daemon":
-        border_style = "green"
-        title = f"[green]🧠 Daemon[/] • {msg_type.upper()}"
+    # ISO-8601 fast path: slice HH:MM:SS instead of parsing
+    if len(timestamp) >= 19 and timestamp[10] == 'T':
+        time_str = timestamp[11:19]
+    else:
+        try:
+            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            time_str = dt.strftime("%H:%M:%S")
+        except:
+            time_str = timestamp[:8] if timestamp else "??:??:??"
+
+    style = _PANEL_STYLES.get(sender)
+    if style:
+        border_style, label = style
+        title = f"{label} • {msg_type.upper()}"
     else:
         border_style = "white"
         title = f"⚡ {sender} • {msg_type}"
 
     # Render content
-    if isinstance(content, str) and ('```' in content or '#' in content[:5]):
+    # Only pay for the Markdown parser when there is markdown to render
+    if isinstance(content, str) and ('```' in content or content.lstrip().startswith('#')):
         try:
             rendered_content = Markdown(content)
         except:
@@ -103,15 +99,20 @@ def print_message(console, msg):
     else:
         rendered_content = Text(str(content), style="white")
 
-    panel = Panel(
+    return Panel(
         rendered_content,
         title=f"{title} ({time_str})",
         border_style=border_style,
         box=ROUNDED,
         padding=(0, 2)
     )
-    
-    console.print(panel)
+
+def print_message(console, msg):
+    """Prints a single message panel to the console."""
+    if not msg:
+        return
+
+    console.print(render_message(msg))
 
 def main():
     console = Console()
@@ -132,6 +133,9 @@ def main():
             if msg:
                 print_message(console, msg)
                 
+    except redis.ConnectionError as e:
+        console.print(f"[red]❌ Failed to connect to Redis: {e}[/]")
+        sys.exit(1)
     except Exception as e:
         console.print(f"[red]Error loading history: {e}[/]")
         last_id = '0'
@@ -141,15 +145,19 @@ def main():
     # 2. Listen for New Messages
     while True:
         try:
-            # Block for 1000ms
-            resp = redis_conn.xread({STREAM_KEY: last_id}, count=1, block=1000)
+            # Block until new entries arrive (no idle wakeups); Ctrl+C still interrupts
+            resp = redis_conn.xread({STREAM_KEY: last_id}, count=100, block=0)
             if resp:
+                panels = []
                 for _, stream_entries in resp:
                     for entry in stream_entries:
                         last_id = entry[0]
                         msg = parse_message(entry)
                         if msg:
-                            print_message(console, msg)
+                            panels.append(render_message(msg))
+                # One print (and one terminal write) per batch
+                if panels:
+                    console.print(Group(*panels))
                             
         except KeyboardInterrupt:
             console.print("\n[bold red]👋 Exiting...[/]")
@@ -4,6 +4,10 @@
 import subprocess
 import json
 
+# Resolved secrets for this process, keyed by op:// reference. Only
+# successful reads are cached so a locked or offline op is retried.
+_SECRETS = {}
+
 def create_1password_vault(vault_name="Bicameral"):
     """Create 1Password vault for Bicameral secrets"""
     try:
@@ -48,8 +52,11 @@ def get_secret(reference):
         reference: op:// reference (e.g., "op://Bicameral/Local Redis/password")
 
     Returns:
-        Secret value
+        Secret value, or None if it could not be read
     """
+    if reference in _SECRETS:
+        return _SECRETS[reference]
+
     try:
         result = subprocess.run(
             ['op', 'read', reference],
@@ -57,6 +64,46 @@ def get_secret(reference):
             check=True,
             timeout=5
         )
-        return result.stdout.decode().strip()
-    except subprocess.CalledProcessError:
+        value = _SECRETS[reference] = result.stdout.decode().strip()
+        return value
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
         return None
+
+def get_secrets(references):
+    """
+    Get several secrets from 1Password with a single `op inject` call
+
+    Args:
+        references: Iterable of op:// references (single-line values)
+
+    Returns:
+        Dict of reference: value (None for references that failed)
+    """
+    references = list(dict.fromkeys(references))
+    missing = [ref for ref in references if ref not in _SECRETS]
+
+    if missing:
+        template = ''.join(f'{{{{ {ref} }}}}\n' for ref in missing)
+        try:
+            result = subprocess.run(
+                ['op', 'inject'],
+                input=template.encode(),
+                capture_output=True,
+                check=True,
+                timeout=10
+            )
+            values = result.stdout.decode().split('\n')
+            # One line per reference plus the trailing newline; anything
+            # else means a multi-line value, so leave it to op read
+            if len(values) == len(missing) + 1:
+                for ref, value in zip(missing, values):
+                    _SECRETS[ref] = value.strip()
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            pass
+
+        # Any reference the batch couldn't resolve falls back to op read
+        for ref in missing:
+            if ref not in _SECRETS:
+                get_secret(ref)
+
+    return {ref: _SECRETS.get(ref) for ref in references}
@@ -5,17 +5,23 @@ Keeps local Redis and VPS Redis in sync bidirectionally
 Ensures resilience: work locally even if VPS is down
 """
 import redis
-import json
+import orjson
 import time
 import os
+import sys
+import fcntl
+import random
+import signal
+import socket
 import logging
+import threading
 from pathlib import Path
-from datetime import datetime
-from dotenv import load_dotenv
+
+from .client import KEEPALIVE_OPTIONS
+from .config import load_env
 
 # Load config
-CONFIG_FILE = Path.home() / '.bicameral' / '.env'
-load_dotenv(CONFIG_FILE, override=True)
+load_env()
 
 # Configuration
 LOCAL_HOST = 'localhost'
@@ -28,7 +34,25 @@ VPS_PASSWORD = os.getenv('REDIS_PASSWORD', 'bicameral_vps_secret')
 
 STREAM_KEY = 'bicameral:stream:collab'
 SYNC_INTERVAL = 2  # seconds
+# Each direction long-polls on its own thread, so an idle daemon wakes once
+# per SYNC_INTERVAL but new messages are picked up immediately
+SYNC_BLOCK_MS = SYNC_INTERVAL * 1000
+# Each direction reads through a consumer group on its source stream, so
+# Redis tracks what has been forwarded and unacked entries are replayed
+# The VPS stream is shared by every machine, so each one needs its own
+# group there (one shared group would hand each entry to a single machine)
+SYNC_NODE_ID = os.getenv('BICAMERAL_NODE_ID') or socket.gethostname()
+LOCAL_GROUP = 'sync-to-vps'                   # on the local stream
+VPS_GROUP = f'sync-to-local:{SYNC_NODE_ID}'   # on the VPS stream
+SYNC_CONSUMER = 'daemon'
+# Marks an entry re-added under a new ID (see _resolve_behind) with the
+# node that copied it, so the copy is not synced back as a new message
+SYNC_COPY_FIELD = 'sync_copy'
+# Cursor key used before consumer groups; migrated on first start
 SYNC_STATE_KEY = 'sync:state'
+VPS_BACKOFF_MAX = 60  # seconds, cap for VPS reconnect backoff
+SYNC_BACKOFF_MAX = 30  # seconds, cap for retrying a batch that keeps failing
+PID_FILE = Path.home() / '.bicameral' / 'sync.pid'
 
 # Logging
 LOG_FILE = Path.home() / '.bicameral' / 'sync_daemon.log'
@@ -44,28 +68,88 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _make_client(host, port, password, connect_timeout):
+    """Redis client on its own small keepalive pool
+
+    Keepalive and periodic health checks surface a half-open VPS link
+    before a sync batch is written into it (redis-py sets TCP_NODELAY).
+    """
+    pool = redis.ConnectionPool(
+        host=host,
+        port=port,
+        password=password,
+        max_connections=4,
+        socket_connect_timeout=connect_timeout,
+        socket_keepalive=True,
+        socket_keepalive_options=KEEPALIVE_OPTIONS,
+        health_check_interval=15,
+        decode_responses=True
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+def _stream_id(msg_id):
+    """Stream ID as a (ms, seq) tuple for numeric comparison"""
+    ms, _, seq = msg_id.partition('-')
+    return int(ms), int(seq or 0)
+
+
+def _is_behind(reply):
+    """XADD rejected the ID because the target's last ID is not smaller"""
+    return isinstance(reply, redis.ResponseError) and 'equal or smaller' in str(reply)
+
+
+def _synced_prefix(messages, replies):
+    """Last ID of the contiguous run of messages that reached the target
+
+    Stops at the first error, or at an ID that goes backwards, so nothing
+    unsynced is acknowledged. Returns (last_id or None, first error or None).
+    """
+    last_id = None
+    for (msg_id, _), reply in zip(messages, replies):
+        if isinstance(reply, redis.ResponseError):
+            return last_id, reply
+        if last_id is not None and _stream_id(msg_id) <= _stream_id(last_id):
+            return last_id, ValueError(f"out-of-order stream ID {msg_id}")
+        last_id = msg_id
+    return last_id, None
+
+
+def _is_echo(data, from_local):
+    """Entry is a re-added copy that must not be synced back
+
+    Locally every copy came from the VPS; on the VPS only this node's
+    copies are echoes, other machines still need the rest.
+    """
+    node = data.get(SYNC_COPY_FIELD)
+    return node is not None and (from_local or node == SYNC_NODE_ID)
+
+
 class RedisSyncDaemon:
     """Bidirectional sync between local and VPS Redis"""
 
     def __init__(self):
         self.local = None
         self.vps = None
-        self.local_last_id = '$'
-        self.vps_last_id = '$'
         self.running = True
+        # Cursors from a pre-consumer-group sync:state key, until migrated
+        self._legacy_ids = {}
+        # Per group: replay this consumer's unacked entries before new ones
+        self._backlog = {LOCAL_GROUP: True, VPS_GROUP: True}
+        # Per group: pause before retrying a batch that failed with an error reply
+        self._retry_delay = {LOCAL_GROUP: 0.0, VPS_GROUP: 0.0}
+        # Set while self.vps is usable; sync threads park on it otherwise
+        self._vps_ready = threading.Event()
+        # Reconnect backoff while the VPS is unreachable
+        self._vps_backoff = 1.0
+        self._next_vps_try = 0.0
 
     def connect(self):
         """Connect to both Redis instances"""
 
         # Local Redis (primary)
         try:
-            self.local = redis.Redis(
-                host=LOCAL_HOST,
-                port=LOCAL_PORT,
-                password=LOCAL_PASSWORD,
-                decode_responses=True,
-                socket_connect_timeout=2
-            )
+            self.local = _make_client(LOCAL_HOST, LOCAL_PORT, LOCAL_PASSWORD, 2)
             self.local.ping()
             logger.info(f"✅ Connected to LOCAL Redis ({LOCAL_HOST}:{LOCAL_PORT})")
         except Exception as e:
@@ -73,163 +157,304 @@ class RedisSyncDaemon:
             logger.error("   Start local Redis: docker compose up -d redis")
             return False
 
+        # Sync positions live in the consumer groups
+        self._load_legacy_ids()
+        self._ensure_group(self.local, LOCAL_GROUP,
+                           self._legacy_ids.get('local_last_id', '$'))
+
         # VPS Redis (sync target)
         try:
-            self.vps = redis.Redis(
-                host=VPS_HOST,
-                port=VPS_PORT,
-                password=VPS_PASSWORD,
-                decode_responses=True,
-                socket_connect_timeout=3
-            )
-            self.vps.ping()
+            vps = _make_client(VPS_HOST, VPS_PORT, VPS_PASSWORD, 3)
+            vps.ping()
+            self._attach_vps(vps)
             logger.info(f"✅ Connected to VPS Redis ({VPS_HOST}:{VPS_PORT})")
         except Exception as e:
             logger.warning(f"⚠️  VPS Redis unavailable: {e}")
             logger.info("   Operating in LOCAL-ONLY mode")
             self.vps = None
 
-        # Load sync state
-        self._load_sync_state()
         return True
 
-    def _load_sync_state(self):
-        """Load last sync positions"""
+    def _load_legacy_ids(self):
+        """Load cursors left by daemons that predate consumer groups"""
         try:
-            if self.local:
-                state = self.local.get(SYNC_STATE_KEY)
-                if state:
-                    data = json.loads(state)
-                    self.local_last_id = data.get('local_last_id', '$')
-                    self.vps_last_id = data.get('vps_last_id', '$')
-                    logger.info(f"📍 Loaded sync state: local={self.local_last_id}, vps={self.vps_last_id}")
+            kind = self.local.type(SYNC_STATE_KEY)
+            if kind == 'string':
+                self._legacy_ids = orjson.loads(self.local.get(SYNC_STATE_KEY))
+            elif kind == 'hash':
+                self._legacy_ids = self.local.hgetall(SYNC_STATE_KEY)
+            if self._legacy_ids:
+                logger.info(f"📍 Migrating sync state: local={self._legacy_ids.get('local_last_id')}, "
+                            f"vps={self._legacy_ids.get('vps_last_id')}")
         except Exception as e:
             logger.warning(f"Failed to load sync state: {e}")
 
-    def _save_sync_state(self):
-        """Save sync positions"""
+    @staticmethod
+    def _ensure_group(r, group, start_id):
+        """Create one direction's consumer group (no-op if it exists)"""
+        try:
+            r.xgroup_create(STREAM_KEY, group, id=start_id, mkstream=True)
+        except redis.ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    def _attach_vps(self, vps):
+        """Hand a freshly pinged VPS client to the sync threads"""
+        self._ensure_group(vps, VPS_GROUP, self._legacy_ids.get('vps_last_id', '$'))
+        if self._legacy_ids:
+            # Both groups exist now; the old cursor key has served its purpose
+            self.local.delete(SYNC_STATE_KEY)
+            self._legacy_ids = {}
+
+        self.vps = vps
+        self._vps_ready.set()
+
+    def _forward(self, source, target, group, direction):
+        """Copy one batch from source to target via source's consumer group"""
+        # After a failure (or at startup) replay our unacked entries first
+        replay = self._backlog[group]
+        entries = source.xreadgroup(group, SYNC_CONSUMER,
+                                    {STREAM_KEY: '0' if replay else '>'},
+                                    count=100, block=None if replay else SYNC_BLOCK_MS)
+        messages = entries[0][1] if entries else []
+        if not messages:
+            self._backlog[group] = False
+            return
+
+        # Pending entries trimmed from the stream come back without data;
+        # copies we re-added ourselves already exist on the other side
+        from_local = source is self.local
+        skip = [msg_id for msg_id, data in messages
+                if data is None or _is_echo(data, from_local)]
+        if skip:
+            source.xack(STREAM_KEY, group, *skip)
+            messages = [m for m in messages if m[0] not in skip]
+            if not messages:
+                return
+
+        # The batch is pending in the group now: if anything below fails,
+        # the next read must replay it rather than move on to '>'
+        self._backlog[group] = True
+
+        # Add the whole batch in one round-trip, with the same IDs
+        # (preserve order)
+        pipe = target.pipeline(transaction=False)
+        for msg_id, data in messages:
+            pipe.xadd(STREAM_KEY, data, id=msg_id)
+        replies = self._resolve_behind(target, messages, pipe.execute(raise_on_error=False),
+                                       direction)
+        last_id, error = _synced_prefix(messages, replies)
+
+        # Acknowledge only what actually reached the target
+        if last_id is not None:
+            ids = [msg_id for msg_id, _ in messages]
+            synced = ids[:ids.index(last_id) + 1]
+            source.xack(STREAM_KEY, group, *synced)
+            logger.info(f"{direction}: synced {len(synced)} messages")
+        if error is not None:
+            raise error
+        # Fully acked; keep replaying only if this was a replay read
+        self._backlog[group] = replay
+
+    @staticmethod
+    def _resolve_behind(target, messages, replies, direction):
+        """Settle XADDs rejected as "equal or smaller"
+
+        Redis rejects any ID at or below the target's last ID, which covers
+        both an entry synced before and a new one that lost a race with a
+        newer write on the target. XRANGE tells them apart; a missing entry
+        is re-added under a fresh ID rather than acknowledged unsynced.
+        """
+        behind = [i for i, reply in enumerate(replies) if _is_behind(reply)]
+        if not behind:
+            return replies
+
+        pipe = target.pipeline(transaction=False)
+        for i in behind:
+            msg_id = messages[i][0]
+            pipe.xrange(STREAM_KEY, min=msg_id, max=msg_id)
+        found = pipe.execute()
+
+        missing = [i for i, entries in zip(behind, found) if not entries]
+        replies = list(replies)
+        for i in behind:
+            replies[i] = messages[i][0]
+        if not missing:
+            return replies
+
+        pipe = target.pipeline(transaction=False)
+        for i in missing:
+            pipe.xadd(STREAM_KEY, {**messages[i][1], SYNC_COPY_FIELD: SYNC_NODE_ID})
+        for i, reply in zip(missing, pipe.execute(raise_on_error=False)):
+            if isinstance(reply, redis.ResponseError):
+                replies[i] = reply
+            else:
+                logger.warning(f"{direction}: {messages[i][0]} is older than the target's "
+                               f"last entry; re-added as {reply}")
+        return replies
+
+    def _sync(self, source, target, group, direction):
+        """Run _forward for one direction, handling Redis errors"""
         try:
-            if self.local:
-                state = {
-                    'local_last_id': self.local_last_id,
-                    'vps_last_id': self.vps_last_id,
-                    'last_sync': datetime.now().isoformat()
-                }
-                self.local.set(SYNC_STATE_KEY, json.dumps(state))
+            self._forward(source, target, group, direction)
+        except redis.ConnectionError as e:
+            logger.warning(f"Sync {direction} failed: {e}")
+            # Either side may have failed; only tear down the VPS link if
+            # it is the one that is down
+            vps = target if source is self.local else source
+            try:
+                vps.ping()
+            except redis.RedisError:
+                self._drop_vps()
+            else:
+                self._back_off(group)  # Local Redis is down
+        except redis.ResponseError as e:
+            logger.warning(f"Sync {direction} failed: {e}")
+            if 'NOGROUP' in str(e):
+                # Stream was deleted (and its group with it); start over
+                self._ensure_group(source, group, '0')
+            self._back_off(group)
         except Exception as e:
-            logger.warning(f"Failed to save sync state: {e}")
+            logger.warning(f"Sync {direction} failed: {e}")
+            self._back_off(group)
+        else:
+            self._retry_delay[group] = 0.0
+
+    def _back_off(self, group):
+        """Pause before retrying, so a persistent error (WRONGTYPE, OOM,
+        MISCONF) doesn't spin the replay read in a tight loop"""
+        delay = min(SYNC_BACKOFF_MAX, max(0.5, self._retry_delay[group] * 2))
+        self._retry_delay[group] = delay
+        time.sleep(delay)
 
     def sync_local_to_vps(self):
         """Sync new local messages to VPS"""
-        if not self.vps:
-            return  # VPS unavailable
-
-        try:
-            # Read new messages from local
-            entries = self.local.xread({STREAM_KEY: self.local_last_id}, count=100, block=0)
-
-            if entries:
-                for stream_name, messages in entries:
-                    for msg_id, data in messages:
-                        # Add to VPS
-                        try:
-                            # Try to add with same ID (preserve order)
-                            self.vps.xadd(STREAM_KEY, data, id=msg_id)
-                            logger.debug(f"→ VPS: {msg_id}")
-                        except:
-                            # If ID exists, just skip (already synced)
-                            pass
-
-                        # Update position
-                        self.local_last_id = msg_id
-
-                logger.info(f"↗ Synced {len(messages)} messages LOCAL → VPS")
-                self._save_sync_state()
-
-        except Exception as e:
-            logger.warning(f"Sync LOCAL → VPS failed: {e}")
-            # Try to reconnect VPS
-            self._reconnect_vps()
+        vps = self.vps  # may be dropped by the other thread meanwhile
+        if vps:
+            self._sync(self.local, vps, LOCAL_GROUP, '↗ LOCAL → VPS')
 
     def sync_vps_to_local(self):
         """Sync new VPS messages to local"""
-        if not self.vps:
-            return  # VPS unavailable
+        vps = self.vps  # may be dropped by the other thread meanwhile
+        if vps:
+            self._sync(vps, self.local, VPS_GROUP, '↙ VPS → LOCAL')
 
-        try:
-            # Read new messages from VPS
-            entries = self.vps.xread({STREAM_KEY: self.vps_last_id}, count=100, block=0)
-
-            if entries:
-                for stream_name, messages in entries:
-                    for msg_id, data in messages:
-                        # Add to local
-                        try:
-                            self.local.xadd(STREAM_KEY, data, id=msg_id)
-                            logger.debug(f"← LOCAL: {msg_id}")
-                        except:
-                            # If ID exists, skip
-                            pass
-
-                        # Update position
-                        self.vps_last_id = msg_id
-
-                logger.info(f"↙ Synced {len(messages)} messages VPS → LOCAL")
-                self._save_sync_state()
+    def _drop_vps(self):
+        """Forget the VPS client; run() reconnects with a fresh one"""
+        self._vps_ready.clear()
+        self.vps = None
 
-        except Exception as e:
-            logger.warning(f"Sync VPS → LOCAL failed: {e}")
-            self._reconnect_vps()
+    def _sync_loop(self, sync_fn):
+        """Run one sync direction until the daemon stops"""
+        while self.running:
+            try:
+                # Parked here while the VPS is down; resumes as soon as
+                # _reconnect_vps succeeds
+                if self._vps_ready.wait(SYNC_INTERVAL):
+                    sync_fn()
+            except Exception as e:
+                logger.error(f"Sync error: {e}")
+                time.sleep(5)  # Wait before retry
 
     def _reconnect_vps(self):
         """Try to reconnect to VPS"""
         if self.vps:
             return  # Already connected
+        if time.monotonic() < self._next_vps_try:
+            return  # Backing off
 
         try:
-            self.vps = redis.Redis(
-                host=VPS_HOST,
-                port=VPS_PORT,
-                password=VPS_PASSWORD,
-                decode_responses=True,
-                socket_connect_timeout=3
-            )
-            self.vps.ping()
+            vps = _make_client(VPS_HOST, VPS_PORT, VPS_PASSWORD, 3)
+            vps.ping()
+            # Published only once ready; the sync threads start using it now
+            self._attach_vps(vps)
+            self._vps_backoff = 1.0
+            self._next_vps_try = 0.0
             logger.info(f"✅ Reconnected to VPS Redis")
-        except:
-            pass  # Still offline
+        except redis.RedisError as e:
+            # Still offline: exponential backoff with +/-25% jitter
+            if self._vps_backoff == 1.0:
+                logger.info(f"VPS still unreachable ({e}); backing off up to {VPS_BACKOFF_MAX}s")
+            self._next_vps_try = time.monotonic() + self._vps_backoff * random.uniform(0.75, 1.25)
+            self._vps_backoff = min(VPS_BACKOFF_MAX, self._vps_backoff * 2)
 
     def run(self):
         """Main sync loop"""
         logger.info("🔄 Redis Sync Daemon started")
         logger.info(f"   LOCAL: {LOCAL_HOST}:{LOCAL_PORT}")
         logger.info(f"   VPS:   {VPS_HOST}:{VPS_PORT}")
-        logger.info(f"   Sync interval: {SYNC_INTERVAL}s")
+        logger.info(f"   Sync interval: {SYNC_INTERVAL}s (long-poll)")
         logger.info("")
 
         if not self.connect():
             logger.error("Failed to initialize. Exiting.")
             return
 
+        # One thread per direction, each blocked in its own XREADGROUP
+        workers = [
+            threading.Thread(target=self._sync_loop, args=(fn,),
+                             name=fn.__name__, daemon=True)
+            for fn in (self.sync_local_to_vps, self.sync_vps_to_local)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # Main thread: reconnect VPS, handle signals
         while self.running:
             try:
-                # Bidirectional sync
-                self.sync_local_to_vps()
-                self.sync_vps_to_local()
-
-                # Wait before next sync
                 time.sleep(SYNC_INTERVAL)
 
+                if not self.vps:
+                    self._reconnect_vps()
+
             except KeyboardInterrupt:
                 logger.info("\n🛑 Stopping sync daemon...")
                 self.running = False
             except Exception as e:
                 logger.error(f"Sync error: {e}")
-                time.sleep(5)  # Wait before retry
+
+        # Workers notice self.running within one XREADGROUP block
+        for worker in workers:
+            worker.join(timeout=SYNC_INTERVAL + 1)
 
         logger.info("✅ Sync daemon stopped")
 
 
+def _handle_sigterm(signum, frame):
+    """Stop gracefully on `bicameral sync stop` (SIGTERM)"""
+    raise KeyboardInterrupt
+
+
+def _lock_pid_file():
+    """Write our PID and hold an exclusive lock on the file while we run
+
+    `bicameral sync` trusts the PID only while the lock is held, so a file
+    left behind by a crash or reboot never points at an unrelated process.
+    Returns the open file, or None if another daemon holds the lock.
+    """
+    f = open(PID_FILE, 'a+')
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        f.close()
+        return None
+    f.seek(0)
+    f.truncate()
+    f.write(str(os.getpid()))
+    f.flush()
+    return f
+
+
 if __name__ == "__main__":
-    daemon = RedisSyncDaemon()
-    daemon.run()
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    pid_file = _lock_pid_file()
+    if pid_file is None:
+        logger.error("Sync daemon already running")
+        sys.exit(1)
+    try:
+        daemon = RedisSyncDaemon()
+        daemon.run()
+    finally:
+        # Still locked, so the file is ours
+        PID_FILE.unlink(missing_ok=True)
+        pid_file.close()
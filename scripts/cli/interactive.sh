@@ -23,8 +23,9 @@ echo ""
 
 # Start sync daemon in background
 echo "🔄 Starting sync daemon..."
-if pgrep -f "redis_sync_daemon.py" > /dev/null; then
-    echo "✅ Sync daemon already running (PID: $(pgrep -f redis_sync_daemon.py))"
+DAEMON_PIDS=$(pgrep -f "redis_sync_daemon.py" || true)
+if [ -n "$DAEMON_PIDS" ]; then
+    echo "✅ Sync daemon already running (PID: $DAEMON_PIDS)"
 else
     python3 "$SCRIPT_DIR/redis_sync_daemon.py" > /dev/null 2>&1 &
     DAEMON_PID=$!
@@ -25,6 +25,19 @@ PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
 # Step 1: Check prerequisites
 echo -e "${YELLOW}📋 Step 1/7: Checking prerequisites...${NC}"
 
+# docker info and tailscale version are the slow probes (daemon round-trips);
+# start them now so they overlap instead of running one after another
+PROBE_DIR=$(mktemp -d)
+trap 'rm -rf "$PROBE_DIR"' EXIT
+if command -v docker &> /dev/null; then
+    docker info --format '{{.ServerVersion}}' > "$PROBE_DIR/docker" 2>/dev/null &
+    DOCKER_PROBE_PID=$!
+fi
+if command -v tailscale &> /dev/null; then
+    tailscale version 2>/dev/null | head -1 > "$PROBE_DIR/tailscale" &
+    TAILSCALE_PROBE_PID=$!
+fi
+
 # Python 3.10+
 if ! command -v python3 &> /dev/null; then
     echo -e "${RED}❌ Python 3 not found${NC}"
@@ -40,11 +53,18 @@ if ! command -v docker &> /dev/null; then
     echo "   Install: https://docs.docker.com/get-docker/"
     exit 1
 fi
-echo -e "${GREEN}✅ Docker $(docker --version | awk '{print $3}' | tr -d ',')${NC}"
+# docker info talks to the daemon, so one call covers "installed" and "running"
+if ! wait "$DOCKER_PROBE_PID"; then
+    echo -e "${RED}❌ Docker daemon not running${NC}"
+    echo "   Start Docker Desktop (or dockerd) and re-run setup"
+    exit 1
+fi
+echo -e "${GREEN}✅ Docker $(cat "$PROBE_DIR/docker")${NC}"
 
 # Tailscale (optional)
-if command -v tailscale &> /dev/null; then
-    echo -e "${GREEN}✅ Tailscale $(tailscale version | head -1)${NC}"
+if [ -n "$TAILSCALE_PROBE_PID" ]; then
+    wait "$TAILSCALE_PROBE_PID" || true
+    echo -e "${GREEN}✅ Tailscale $(cat "$PROBE_DIR/tailscale")${NC}"
 else
     echo -e "${YELLOW}⚠️  Tailscale not found (optional for VPS sync)${NC}"
     echo "   Install: https://tailscale.com/download"
@@ -74,8 +94,8 @@ if [ -z "$VIRTUAL_ENV" ]; then
     fi
 fi
 
-pip3 install -q redis python-dotenv rich 2>&1 | grep -v "already satisfied" || true
-echo -e "${GREEN}✅ Packages installed: redis, python-dotenv, rich${NC}"
+pip3 install -q redis python-dotenv rich orjson 2>&1 | grep -v "already satisfied" || true
+echo -e "${GREEN}✅ Packages installed: redis, python-dotenv, rich, orjson${NC}"
 echo ""
 
 # Step 3: Create directory structure
@@ -122,8 +142,10 @@ if [ -z "$SKIP_CONFIG" ]; then
     read -p "   Gateway API URL [https://api.rhncrs.com]: " GATEWAY_URL
     GATEWAY_URL=${GATEWAY_URL:-https://api.rhncrs.com}
 
-    # Create config file
-    cat > ~/.bicameral/.env << EOF
+    # Create config file: write a private (0600) temp file, then rename it
+    # into place so an interrupted setup never leaves a half-written .env
+    ENV_TMP=$(mktemp ~/.bicameral/.env.XXXXXX)
+    cat > "$ENV_TMP" << EOF
 # Bicameral Unified Configuration
 # Generated: $(date)
 
@@ -145,7 +167,8 @@ GATEWAY_TOKEN=$GATEWAY_TOKEN
 STREAM_KEY=bicameral:stream:collab
 EOF
 
-    chmod 600 ~/.bicameral/.env
+    chmod 600 "$ENV_TMP"
+    mv -f "$ENV_TMP" ~/.bicameral/.env
     echo -e "${GREEN}✅ Configuration saved to ~/.bicameral/.env${NC}"
     echo ""
 else
@@ -158,10 +181,11 @@ source ~/.bicameral/.env
 # Step 6: Start local Redis
 echo -e "${YELLOW}🚀 Step 6/7: Starting local Redis...${NC}"
 
-# Check if Redis is already running
-if docker ps | grep -q bicameral-redis; then
+# Check if Redis is already running (one inspect: "true", "false", or no container)
+REDIS_STATE=$(docker inspect -f '{{.State.Running}}' bicameral-redis 2>/dev/null || true)
+if [ "$REDIS_STATE" = "true" ]; then
     echo -e "${GREEN}✅ Redis already running${NC}"
-elif docker ps -a | grep -q bicameral-redis; then
+elif [ "$REDIS_STATE" = "false" ]; then
     echo -e "${YELLOW}⚠️  Redis container exists but stopped${NC}"
     docker start bicameral-redis
     echo -e "${GREEN}✅ Redis started${NC}"
@@ -175,15 +199,19 @@ else
         redis-server --appendonly yes --requirepass "$LOCAL_REDIS_PASSWORD" \
         > /dev/null 2>&1
 
-    # Wait for Redis to be ready
+    # Wait for Redis to be ready: back off 0.05s -> 1s, ~10s budget in total
     echo -n "   Waiting for Redis..."
-    for i in {1..10}; do
+    DELAY=0.05
+    WAITED=0
+    while awk "BEGIN { exit !($WAITED < 10) }"; do
         if docker exec bicameral-redis redis-cli -a "$LOCAL_REDIS_PASSWORD" ping > /dev/null 2>&1; then
             echo " ready!"
             break
         fi
-        sleep 1
+        sleep "$DELAY"
         echo -n "."
+        WAITED=$(awk "BEGIN { print $WAITED + $DELAY }")
+        DELAY=$(awk "BEGIN { d = $DELAY * 2; print (d > 1 ? 1 : d) }")
     done
 
     echo -e "${GREEN}✅ Redis started (container: bicameral-redis)${NC}"
@@ -203,11 +231,6 @@ else
     exit 1
 fi
 
-# Check message in Redis
-MSG_COUNT=$(redis-cli -h localhost -p 6379 -a "$LOCAL_REDIS_PASSWORD" \
-    XLEN bicameral:stream:collab 2>/dev/null)
-echo -e "${GREEN}✅ Messages in stream: $MSG_COUNT${NC}"
-
 echo ""
 echo -e "${GREEN}╔═══════════════════════════════════════════╗${NC}"
 echo -e "${GREEN}║   ✅ SETUP COMPLETE!                     ║${NC}"
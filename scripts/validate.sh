@@ -37,7 +37,7 @@ echo ""
 # Test 1: Python Dependencies
 echo -e "${BLUE}[1/10] Python Dependencies${NC}"
 MISSING_DEPS=""
-for pkg in redis python-dotenv rich; do
+for pkg in redis python-dotenv rich orjson; do
     if python3 -c "import ${pkg//-/_}" 2>/dev/null; then
         echo -e "  ${GREEN}✅ $pkg${NC}"
     else